@@ -37,8 +37,12 @@ class AttrFormatter(string.Formatter):
             The list of modifiers, must be the as long as the longest value of `mapping`.
         """
         super().__init__()
-        self.modifiers = modifiers
+        self.modifiers = tuple(modifiers)
         self.mapping = mapping
+        # Position of each modifier, the first occurrence wins as with `index`.
+        self._modifiers_index = {}
+        for i, mod in enumerate(self.modifiers):
+            self._modifiers_index.setdefault(mod, i)
 
     def format_field(self, value, format_spec):
         """Format a value given a formatting spec.
@@ -68,9 +72,9 @@ class AttrFormatter(string.Formatter):
         if baseval is not None and not format_spec:
             return self.mapping[baseval][0]
 
-        if format_spec in self.modifiers:
+        if format_spec in self._modifiers_index:
             if baseval is not None:
-                return self.mapping[baseval][self.modifiers.index(format_spec)]
+                return self.mapping[baseval][self._modifiers_index[format_spec]]
             raise ValueError(
                 f"No known mapping for string '{value}' with modifier '{format_spec}'"
             )
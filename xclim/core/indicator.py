@@ -347,6 +347,15 @@ class Indicator(IndicatorRegistrar):
         # And before converting callables to staticmethods
         kwds["cf_attrs"] = cls._parse_cf_attrs(kwds)
 
+        # Keys of the outputs in the locale dictionaries (see `xclim.core.locales`)
+        if len(kwds["cf_attrs"]) > 1:
+            kwds["_locale_ids"] = [
+                f"{identifier.upper()}.{attrs['var_name']}"
+                for attrs in kwds["cf_attrs"]
+            ]
+        else:
+            kwds["_locale_ids"] = [identifier.upper()]
+
         # Convert function objects to static methods.
         for key in cls._funcs + cls._cf_names:
             if key in kwds and callable(kwds[key]):
@@ -445,11 +454,18 @@ class Indicator(IndicatorRegistrar):
         # Metadata attributes from templates
         var_id = None
         var_attrs = []
-        for attrs in self.cf_attrs:
+        for attrs, locale_id in zip(self.cf_attrs, self._locale_ids):
             if n_outs > 1:
                 var_id = f"{self.identifier}.{attrs['var_name']}"
             var_attrs.append(
-                self._update_attrs(ba, das, attrs, names=self._cf_names, var_id=var_id)
+                self._update_attrs(
+                    ba,
+                    das,
+                    attrs,
+                    names=self._cf_names,
+                    var_id=var_id,
+                    locale_id=locale_id,
+                )
             )
 
         # Pre-computation validation checks on DataArray arguments
@@ -538,7 +554,7 @@ class Indicator(IndicatorRegistrar):
             return func(*ba.args, **ba.kwargs)
 
     @classmethod
-    def _update_attrs(cls, ba, das, attrs, var_id=None, names=None):
+    def _update_attrs(cls, ba, das, attrs, var_id=None, names=None, locale_id=None):
         """Format attributes with the run-time values of `compute` call parameters.
 
         Cell methods and xclim_history attributes are updated, adding to existing values. The language of the string is
@@ -553,12 +569,13 @@ class Indicator(IndicatorRegistrar):
         attrs : Mapping[str, str]
           The attributes to format and update.
         var_id : str
-          The identifier to use when requesting the attributes translations.
-          Defaults to the class name (for the translations) or the `identifier` field of the class (for the xclim_history attribute).
-          If given, the identifier will be converted to uppercase to get the translation attributes.
-          This is meant for multi-outputs indicators.
+          The identifier to use in the xclim_history attribute.
+          Defaults to the `identifier` field of the class. This is meant for multi-outputs indicators.
         names : Sequence[str]
           List of attribute names for which to get a translation.
+        locale_id : str
+          The identifier to use when requesting the attributes translations.
+          Defaults to the class name. This is meant for multi-outputs indicators.
 
         Returns
         -------
@@ -573,7 +590,7 @@ class Indicator(IndicatorRegistrar):
             out.update(
                 cls._format(
                     get_local_attrs(
-                        (var_id or cls.__name__).upper(),
+                        locale_id or cls.__name__,
                         locale,
                         names=names or list(attrs.keys()),
                         append_locale_name=True,
@@ -655,19 +672,19 @@ class Indicator(IndicatorRegistrar):
             return attrs
 
         # Translate global attrs
-        attrid = str(self.identifier).upper()
         attrs = _translate(
-            attrid,
+            self.__class__.__name__,
             self.__dict__,
             # Translate only translatable attrs that are not variable attrs
             set(TRANSLATABLE_ATTRS).difference(set(self._cf_names)),
         )
         # Translate variable attrs
         attrs["outputs"] = []
-        for var_attrs in self.cf_attrs:  # Translate for each variable
-            if len(self.cf_attrs) > 1:
-                attrid = f"{str(self.identifier).upper()}.{var_attrs['var_name']}"
-            attrs["outputs"].append(_translate(attrid, var_attrs, TRANSLATABLE_ATTRS))
+        # Translate for each variable
+        for var_attrs, locale_id in zip(self.cf_attrs, self._locale_ids):
+            attrs["outputs"].append(
+                _translate(locale_id, var_attrs, TRANSLATABLE_ATTRS)
+            )
         return attrs
 
     def json(self, args=None):
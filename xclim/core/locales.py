@@ -51,15 +51,30 @@ Attributes
 TRANSLATABLE_ATTRS
     List of attributes to consider translatable when generating locale dictionaries.
 """
-import json
 import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Sequence, Tuple, Union
-
-import pkg_resources
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple, Union
 
 from .formatting import AttrFormatter
 
+try:
+    from importlib.resources import files as _resource_files
+except ImportError:
+    # `importlib.resources.files` is only available from python 3.9
+    import pkg_resources
+
+    def _resource_files(package):
+        return Path(pkg_resources.resource_filename(package, ""))
+
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson is not a dependency of xclim, it only speeds up the parsing of locales
+    from json import loads as _json_loads
+
+
 TRANSLATABLE_ATTRS = [
     "long_name",
     "description",
@@ -70,10 +85,31 @@ TRANSLATABLE_ATTRS = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _available_locales() -> FrozenSet[str]:
+    return frozenset(
+        locfile.name.split(".")[0]
+        for locfile in _resource_files("xclim.locales").iterdir()
+        if locfile.name.endswith(".json")
+    )
+
+
+@lru_cache(maxsize=1)
+def _locales_by_language() -> Dict[str, str]:
+    """Map each language tag to the available locale to use for it.
+
+    Locales are sorted, so a locale without territory is preferred for its language
+    and otherwise the choice doesn't depend on the order of the files on disk.
+    """
+    by_lang = {}
+    for locale in sorted(_available_locales()):
+        by_lang.setdefault(locale.split("-")[0], locale)
+    return by_lang
+
+
 def list_locales():
-    """Return a list of available locales in xclim."""
-    locale_list = pkg_resources.resource_listdir("xclim.locales", "")
-    return [locale.split(".")[0] for locale in locale_list if locale.endswith(".json")]
+    """Return a sorted list of available locales in xclim."""
+    return sorted(_available_locales())
 
 
 def _valid_locales(locales):
@@ -90,6 +126,7 @@ def _valid_locales(locales):
     )
 
 
+@lru_cache(maxsize=128)
 def get_best_locale(locale: str):
     """Get the best fitting available locale.
 
@@ -106,15 +143,17 @@ def get_best_locale(locale: str):
     str or None:
         The best available locale. None is none are available.
     """
-    available = list_locales()
-    if locale in available:
-        return locale
-    locale = locale.split("-")[0]
-    if locale in available:
+    if locale in _available_locales():
         return locale
-    if locale in [av.split("-")[0] for av in available]:
-        return [av for av in available if av.split("-")[0] == locale][0]
-    return None
+    return _locales_by_language().get(locale.split("-")[0])
+
+
+@lru_cache(maxsize=None)
+def _load_locale_json(locale: str) -> dict:
+    """Load and parse the json file of an xclim-provided locale, caching the result."""
+    return _json_loads(
+        _resource_files("xclim.locales").joinpath(f"{locale}.json").read_bytes()
+    )
 
 
 def get_local_dict(locale: Union[str, Sequence[str], Tuple[str, dict]]):
@@ -138,20 +177,23 @@ def get_local_dict(locale: Union[str, Sequence[str], Tuple[str, dict]]):
         The best fitting locale string
     dict
         The available translations in this locale.
+
+    Notes
+    -----
+    Translations of xclim-provided locales are cached and the same dictionary is returned
+    on each call. It should not be modified in place, make a deep copy first if needed.
     """
     if isinstance(locale, str):
-        locale = get_best_locale(locale)
-        if locale is None:
+        best_locale = get_best_locale(locale)
+        if best_locale is None:
             raise UnavailableLocaleError(locale)
 
-        return (
-            locale,
-            json.load(pkg_resources.resource_stream("xclim.locales", f"{locale}.json")),
-        )
-    if isinstance(locale[1], dict):
-        return locale
-    with open(locale[1], encoding="utf-8") as locf:
-        return locale[0], json.load(locf)
+        return best_locale, _load_locale_json(best_locale)
+
+    loc_name, translations = locale
+    if isinstance(translations, dict):
+        return loc_name, translations
+    return loc_name, _json_loads(Path(translations).read_bytes())
 
 
 def get_local_attrs(
@@ -186,27 +228,81 @@ def get_local_attrs(
     -------
     dict
         All CF attributes available for given indicator and locales.
-        Warns and returns an empty dict if none were available.
+        Warns and returns an empty dict if none were available. If `names` has
+        no translatable attributes, an empty dict is returned without loading the locales.
+
+    See Also
+    --------
+    get_all_local_attrs : The same for multiple indicators at once.
+    """
+    return get_all_local_attrs(
+        [indicator], *locales, names=names, append_locale_name=append_locale_name
+    )[indicator]
+
+
+def get_all_local_attrs(
+    indicators: Sequence[str],
+    *locales: Union[str, Sequence[str], Tuple[str, dict]],
+    names: Optional[Sequence[str]] = None,
+    append_locale_name: bool = True,
+) -> Dict[str, dict]:
+    """Get all attributes of multiple indicators in the requested locales.
+
+    Each locale is loaded only once for all indicators.
+
+    Parameters
+    ----------
+    indicators : Sequence[str]
+        Indicators' class names, usually the same as in `xc.core.indicator.registry`.
+    *locales : str
+        IETF language tag or a tuple of the language tag and a translation dict, or
+        a tuple of the language tag and a path to a json file defining translation
+        of attributes.
+    names : Optional[Sequence[str]]
+        If given, only returns translations of attributes in this list.
+    append_locale_name : bool
+        If True (default), append the language tag (as "{attr_name}_{locale}") to the
+        returned attributes.
+
+    Raises
+    ------
+    ValueError
+        If `append_locale_name` is False and multiple `locales` are requested.
+
+    Returns
+    -------
+    dict
+        A mapping from each indicator to its attributes, as returned by `get_local_attrs`.
     """
     if not append_locale_name and len(locales) > 1:
         raise ValueError(
             "`append_locale_name` cannot be False if multiple locales are requested."
         )
 
-    attrs = {}
+    all_attrs = {indicator: {} for indicator in indicators}
+
+    if names is None:
+        names = TRANSLATABLE_ATTRS
+    else:
+        requested = set(names)
+        names = [name for name in TRANSLATABLE_ATTRS if name in requested]
+        if not names:
+            return all_attrs
+
     for locale in locales:
         loc_name, loc_dict = get_local_dict(locale)
         loc_name = f"_{loc_name}" if append_locale_name else ""
-        local_attrs = loc_dict.get(indicator)
-        if local_attrs is None:
-            warnings.warn(
-                f"Attributes of indicator {indicator} in language {locale} were requested, but none were found."
-            )
-        else:
-            for name in TRANSLATABLE_ATTRS:
-                if (names is None or name in names) and name in local_attrs:
-                    attrs[f"{name}{loc_name}"] = local_attrs[name]
-    return attrs
+        for indicator, attrs in all_attrs.items():
+            local_attrs = loc_dict.get(indicator)
+            if local_attrs is None:
+                warnings.warn(
+                    f"Attributes of indicator {indicator} in language {locale} were requested, but none were found."
+                )
+            else:
+                for name in names:
+                    if name in local_attrs:
+                        attrs[f"{name}{loc_name}"] = local_attrs[name]
+    return all_attrs
 
 
 def get_local_formatter(locale: Union[str, Sequence[str], Tuple[str, dict]]):
@@ -219,10 +315,28 @@ def get_local_formatter(locale: Union[str, Sequence[str], Tuple[str, dict]]):
         a tuple of the language tag and a path to a json file defining translation
         of attributes.
     """
+    if isinstance(locale, str):
+        best_locale = get_best_locale(locale)
+        if best_locale is None:
+            raise UnavailableLocaleError(locale)
+        return _cached_local_formatter(best_locale)
+
     loc_name, loc_dict = get_local_dict(locale)
-    attrs_mapping = loc_dict["attrs_mapping"].copy()
-    mods = attrs_mapping.pop("modifiers")
-    return AttrFormatter(attrs_mapping, mods)
+    return AttrFormatter(*_split_attrs_mapping(loc_dict))
+
+
+def _split_attrs_mapping(loc_dict: dict) -> Tuple[dict, Tuple[str, ...]]:
+    """Split the "attrs_mapping" entry of a locale dictionary into the mapping and the modifiers."""
+    attrs_mapping = {
+        key: val for key, val in loc_dict["attrs_mapping"].items() if key != "modifiers"
+    }
+    return attrs_mapping, tuple(loc_dict["attrs_mapping"]["modifiers"])
+
+
+@lru_cache(maxsize=None)
+def _cached_local_formatter(locale: str) -> AttrFormatter:
+    """Return the AttrFormatter of an xclim-provided locale, built only once."""
+    return AttrFormatter(*_split_attrs_mapping(_load_locale_json(locale)))
 
 
 class UnavailableLocaleError(ValueError):
@@ -18,7 +18,7 @@ MISSING_OPTIONS = "missing_options"
 MISSING_METHODS: Dict[str, Callable] = dict()
 
 OPTIONS = {
-    METADATA_LOCALES: [],
+    METADATA_LOCALES: (),
     DATA_VALIDATION: "raise",
     CF_COMPLIANCE: "warn",
     CHECK_MISSING: "any",
@@ -56,7 +56,15 @@ def _set_missing_options(mopts):
         OPTIONS[MISSING_OPTIONS][meth].update(opts)
 
 
-_SETTERS = {MISSING_OPTIONS: _set_missing_options}
+def _set_metadata_locales(locales):
+    # Store an immutable copy, so the validated locales can't be modified in place
+    OPTIONS[METADATA_LOCALES] = tuple(locales)
+
+
+_SETTERS = {
+    MISSING_OPTIONS: _set_missing_options,
+    METADATA_LOCALES: _set_metadata_locales,
+}
 
 
 def register_missing_method(name: str) -> Callable:
@@ -122,7 +130,7 @@ class set_options:
         tuples of language tags and a translation dict, or
         tuples of language tags and a path to a json file defining translation
         of attributes.
-      Default: ``[]``.
+      Stored as a tuple. Default: ``()``.
     - ``data_validation``: Whether to 'log',  'raise' an error or
         'warn' the user on inputs that fail the data checks in `xclim.core.datachecks`.
       Default: ``'raise'``.
@@ -1,4 +1,6 @@
 """Locales and language support module."""
+from copy import deepcopy
+
 from xclim.core.formatting import default_formatter
 from xclim.core.locales import TRANSLATABLE_ATTRS, get_best_locale, get_local_dict
 
@@ -18,10 +20,14 @@ def generate_local_dict(locale: str, init_english: bool = False):
 
     best_locale = get_best_locale(locale)
     if best_locale is not None:
-        locname, attrs = get_local_dict(best_locale)
-        for ind_name in attrs.copy().keys():
-            if ind_name != "attrs_mapping" and ind_name not in registry:
-                attrs.pop(ind_name)
+        locname, loc_dict = get_local_dict(best_locale)
+        valid_ids = {"attrs_mapping"}.union(
+            registry.keys(), *(ind._locale_ids for ind in registry.values())
+        )
+        # The locale dictionary is cached, only copy the entries to keep.
+        attrs = {
+            key: deepcopy(value) for key, value in loc_dict.items() if key in valid_ids
+        }
     else:
         attrs = {}
 
@@ -42,10 +48,9 @@ def generate_local_dict(locale: str, init_english: bool = False):
                     eng_attr = ""
             ind_attrs.setdefault(f"{translatable_attr}", eng_attr)
 
-        for var_attrs in indicator.cf_attrs:
-            # In the case of single output, put var attrs in main dict
-            if len(indicator.cf_attrs) > 1:
-                ind_attrs = attrs.setdefault(f"{ind_name}.{var_attrs['var_name']}", {})
+        for var_attrs, locale_id in zip(indicator.cf_attrs, indicator._locale_ids):
+            # In the case of single output, var attrs are put in main dict
+            ind_attrs = attrs.setdefault(locale_id, {})
 
             for translatable_attr in set(TRANSLATABLE_ATTRS).intersection(
                 set(indicator._cf_names)
@@ -33,3 +33,14 @@ def test_indicator_docstring():
 
     doc = degree_days_exceedance_date.__doc__.split("\n")
     assert doc[20] == "  Default : >. "
+
+
+def test_attr_formatter_modifiers():
+    attrfmt = fmt.AttrFormatter(
+        {"AS-*": ["annuel", "annuelle", "annuels"], "MS": ["mensuel", "mensuelle"]},
+        ["m", "f", "m"],
+    )
+    assert attrfmt.modifiers == ("m", "f", "m")
+    # The first occurrence of a repeated modifier is used
+    assert attrfmt.format("{freq:m}", freq="AS-JUL") == "annuel"
+    assert attrfmt.format("{freq:f}", freq="MS") == "mensuelle"
@@ -3,6 +3,7 @@
 # Tests for `xclim.locales`
 import json
 import warnings
+from copy import deepcopy
 
 import numpy as np
 import pytest
@@ -46,6 +47,24 @@ def test_best_locale():
     assert xloc.get_best_locale("en") is None
 
 
+def test_best_locale_matching(monkeypatch):
+    monkeypatch.setattr(
+        xloc, "_available_locales", lambda: frozenset(["fr-BE", "en-US", "fr", "en-GB"])
+    )
+    xloc._locales_by_language.cache_clear()
+    xloc.get_best_locale.cache_clear()
+    try:
+        assert xloc.get_best_locale("fr-BE") == "fr-BE"
+        assert xloc.get_best_locale("fr-CA") == "fr"
+        assert xloc.get_best_locale("en") == "en-GB"
+        assert xloc.get_best_locale("en-CA") == "en-GB"
+        assert xloc.get_best_locale("de") is None
+    finally:
+        monkeypatch.undo()
+        xloc._locales_by_language.cache_clear()
+        xloc.get_best_locale.cache_clear()
+
+
 def test_local_dict(tmp_path):
     loc, dic = xloc.get_local_dict("fr")
     assert loc == "fr"
@@ -68,6 +87,19 @@ def test_local_dict(tmp_path):
         xloc.get_local_dict("tlh")
 
 
+def test_local_dict_cached():
+    loc, dic = xloc.get_local_dict("fr")
+    loc2, dic2 = xloc.get_local_dict("fr-CA")
+    assert loc2 == loc
+    assert dic2 is dic
+
+    # Generating a local dict must not modify the cached translations
+    expected = deepcopy(dic)
+    generate_local_dict("fr")
+    assert xloc.get_local_dict("fr")[1] == expected
+    assert "keywords" not in dic["TG_MEAN"]
+
+
 def test_local_attrs_sing():
     attrs = xloc.get_local_attrs(
         atmos.tg_mean.__class__.__name__, esperanto, append_locale_name=False
@@ -79,6 +111,11 @@ def test_local_attrs_sing():
             atmos.tg_mean, "fr", esperanto, append_locale_name=False
         )
 
+    attrs = xloc.get_local_attrs(
+        atmos.tg_mean.__class__.__name__, "fr", names=["units", "cell_methods"]
+    )
+    assert attrs == {}
+
 
 def test_local_attrs_multi(tmp_path):
     with (tmp_path / "ru.json").open("w", encoding="utf-8") as f:
@@ -97,11 +134,26 @@ def test_local_attrs_multi(tmp_path):
         assert key not in attrs
 
 
+def test_all_local_attrs():
+    all_attrs = xloc.get_all_local_attrs(
+        ["TG_MEAN", "TN_MIN"], "fr", esperanto, names=["long_name", "units"]
+    )
+    assert set(all_attrs.keys()) == {"TG_MEAN", "TN_MIN"}
+    assert all_attrs["TG_MEAN"] == xloc.get_local_attrs(
+        "TG_MEAN", "fr", esperanto, names=["long_name", "units"]
+    )
+    assert "long_name_fr" in all_attrs["TN_MIN"]
+    assert "long_name_eo" not in all_attrs["TN_MIN"]
+
+
 def test_local_formatter():
     fmt = xloc.get_local_formatter(russian)
     assert fmt.format("{freq:nn}", freq="AS-JUL") == "годовое"
     assert fmt.format("{freq:nf}", freq="AS-DEC") == "годовая"
 
+    # Formatters of xclim-provided locales are built once
+    assert xloc.get_local_formatter("fr") is xloc.get_local_formatter("fr-CA")
+
 
 def test_indicator_output(tas_series):
     tas = tas_series(np.zeros(365))
@@ -116,6 +168,21 @@ def test_indicator_output(tas_series):
     )
 
 
+def test_indicator_output_multi(tas_series):
+    uas = tas_series(np.ones(365))
+    uas.attrs.update(units="m s-1", standard_name="eastward_wind")
+    vas = tas_series(np.ones(365))
+    vas.attrs.update(units="m s-1", standard_name="northward_wind")
+
+    with set_options(metadata_locales=["fr"]):
+        sfcwind, sfcwinddir = atmos.wind_speed_from_vector(uas, vas)
+
+    assert sfcwind.attrs["long_name_fr"] == "Vitesse du vent de surface"
+    assert (
+        sfcwinddir.attrs["long_name_fr"] == "Direction de provenance du vent de surface"
+    )
+
+
 def test_indicator_integration():
     eo_attrs = atmos.tg_mean.translate_attrs(esperanto, fill_missing=True)
     assert "title" in eo_attrs
@@ -167,3 +234,12 @@ def test_local_dict_generation(initeng, expected):
     assert "attrs_mapping" in dic
     assert "modifiers" in dic["attrs_mapping"]
     assert dic["TG_MEAN"]["long_name"] == expected
+
+
+def test_local_dict_generation_keeps_translations():
+    dic = generate_local_dict("fr")
+    assert dic["TG_MEAN"]["long_name"] == (
+        "Moyenne de la température journalière moyenne"
+    )
+    # Translations of the outputs of multi-outputs indicators are kept
+    assert dic["FWI.dc"]["long_name"] == "Indice de sécheresse"
@@ -11,7 +11,7 @@ from xclim.core.options import OPTIONS, register_missing_method
 @pytest.mark.parametrize(
     "option,value",
     [
-        ("metadata_locales", ["fr"]),
+        ("metadata_locales", ("fr",)),
         ("data_validation", "log"),
         ("data_validation", "raise"),
         ("cf_compliance", "log"),
@@ -35,6 +35,14 @@ def test_set_options_valid(option, value):
     assert OPTIONS[option] == old
 
 
+def test_set_metadata_locales_copy():
+    locales = ["fr"]
+    with set_options(metadata_locales=locales):
+        locales.append("tlh")
+        assert OPTIONS["metadata_locales"] == ("fr",)
+    assert OPTIONS["metadata_locales"] == ()
+
+
 @pytest.mark.parametrize(
     "option,value",
     [